@@ -1,13 +1,107 @@
 import streamlit as st
 import os
+import asyncio
+import hashlib
 from dotenv import load_dotenv
-from anthropic import Anthropic
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from anthropic import Anthropic, AsyncAnthropic
+from diskcache import Cache
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Tuple
 import json
 
 load_dotenv()
 
+MODEL_OPTIONS = {
+    "Fast": "claude-haiku-4-5",
+    "Balanced": "claude-sonnet-4-5-20250929",
+    "Best": "claude-opus-4-5",
+}
+
+STATIC_PREFIX = """You are an expert hackathon mentor analyzing a team's idea. Provide a structured analysis.
+
+Prepare an executive summary, implementation plan, risks, build checklist and tech stack for this idea, and record them with the record_analysis tool.
+"""
+
+PITCH_DECK_PREFIX = """You are an expert hackathon mentor. Write a 5-slide pitch deck for the team's idea below. Each slide is 2-3 concise paragraphs, judge-ready. Record the slides with the record_pitch_deck tool.
+"""
+
+DIMENSION_PREFIX = """You are an expert hackathon mentor analyzing a team's idea. Score the idea on a single evaluation dimension from 0 to 5 and record it with the record_score tool.
+"""
+
+RECORD_ANALYSIS_TOOL = {
+    "name": "record_analysis",
+    "description": "Return the hackathon idea analysis.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "executive_summary": {"type": "string", "description": "2-3 sentence high-level assessment"},
+            "detailed_plan": {"type": "string", "description": "Structured implementation plan with at most 6 key milestones, under 300 words"},
+            "risk_flags": {"type": "array", "items": {"type": "string"}, "description": "3-5 one-sentence risks"},
+            "build_checklist": {"type": "array", "items": {"type": "string"}, "description": "At most 12 short tasks"},
+            "tech_stack": {
+                "type": "object",
+                "description": "Technologies by category, e.g. Frontend, Backend, AI/ML, Infrastructure, Tools",
+                "additionalProperties": {"type": "array", "items": {"type": "string"}}
+            }
+        },
+        "required": ["executive_summary", "detailed_plan", "risk_flags", "build_checklist", "tech_stack"]
+    }
+}
+
+RECORD_PITCH_DECK_TOOL = {
+    "name": "record_pitch_deck",
+    "description": "Return the 5-slide pitch deck content.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "slide1_problem": {"type": "string", "description": "Problem: hook, pain points, target audience, why now"},
+            "slide2_solution": {"type": "string", "description": "Solution: approach, 3-4 key features, what makes it unique"},
+            "slide3_techstack": {"type": "string", "description": "Technical approach: stack choices, architecture, scalability"},
+            "slide4_market": {"type": "string", "description": "Market: size (TAM/SAM/SOM), segments, competitors, validation"},
+            "slide5_business_model": {"type": "string", "description": "Business model: revenue, acquisition channels, moat"}
+        },
+        "required": ["slide1_problem", "slide2_solution", "slide3_techstack", "slide4_market", "slide5_business_model"]
+    }
+}
+
+RECORD_SCORE_TOOL = {
+    "name": "record_score",
+    "description": "Return the score for one evaluation dimension.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "score": {"type": "integer", "minimum": 0, "maximum": 5},
+            "reasoning": {"type": "string", "description": "Clear explanation"}
+        },
+        "required": ["score", "reasoning"]
+    }
+}
+
+# (result key, expander title, heading, fallback text, presentation tip) for each slide
+PITCH_DECK_SLIDES = [
+    ("slide1_problem", "🎯 Slide 1: Problem Statement", "### 🔍 The Problem We're Solving",
+     "Problem statement not available",
+     "Start with a relatable scenario or shocking statistic to grab attention"),
+    ("slide2_solution", "💡 Slide 2: Our Solution", "### 🚀 How We Solve It",
+     "Solution description not available",
+     "Demo key features live if possible, use visuals to show before/after"),
+    ("slide3_techstack", "🛠️ Slide 3: Technical Implementation", "### ⚙️ How We Built It",
+     "Technical details not available",
+     "Show architecture diagrams, highlight technical challenges overcome"),
+    ("slide4_market", "📈 Slide 4: Market Opportunity", "### 🌍 Market & Business Impact",
+     "Market analysis not available",
+     "Use charts for market size, mention specific customer validation"),
+    ("slide5_business_model", "💰 Slide 5: Business Strategy", "### 💼 How We Scale & Monetize",
+     "Business model not available",
+     "Show revenue projections, explain competitive advantages clearly"),
+]
+
+# Caps concurrent dimension-scoring requests to stay within API rate limits
+MAX_CONCURRENT_REQUESTS = 4
+
+CACHE_DIR = os.path.expanduser("~/.pitchsnitch_cache")
+CACHE_TTL_SECONDS = 86400
+
 @dataclass
 class IdeaInput:
     idea: str
@@ -19,7 +113,7 @@ class IdeaInput:
 @dataclass
 class EvaluationScore:
     dimension: str
-    score: int
+    score: Optional[int]  # None when the dimension could not be scored
     reasoning: str
 
 @dataclass
@@ -31,11 +125,22 @@ class AnalysisResult:
     build_checklist: List[str]
     tech_stack: Dict[str, List[str]]
     pitch_deck: Dict[str, str]
-    overall_score: float
+    overall_score: Optional[float]
+
+@st.cache_resource
+def _get_cache() -> Optional[Cache]:
+    # One shared handle for the whole app; caching is skipped if the directory is unusable
+    try:
+        return Cache(CACHE_DIR)
+    except Exception:
+        return None
 
 class HackathonIdeaCoach:
-    def __init__(self):
-        self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    def __init__(self, model: str = MODEL_OPTIONS["Fast"]):
+        self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        self.client = Anthropic(api_key=self.api_key)
+        self.model = model
+        self.cache = _get_cache()
         self.evaluation_dimensions = [
             "Problem clarity",
             "User value",
@@ -47,109 +152,330 @@ class HackathonIdeaCoach:
             "Risks & compliance"
         ]
     
-    def analyze_idea(self, idea_input: IdeaInput) -> AnalysisResult:
-        prompt = self._build_analysis_prompt(idea_input)
+    def analyze_idea(self, idea_input: IdeaInput) -> Optional[AnalysisResult]:
+        # Identical inputs return the previous analysis without another API call
+        cache_key = self._cache_key(idea_input)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            try:
+                return self._result_from_dict(cached)
+            except Exception:
+                # Stale or corrupt entries fall through to a fresh analysis
+                pass
         
         try:
-            response = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2000,
-                temperature=0.7,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            # Stream the plan into a placeholder so the user sees progress immediately
+            placeholder = st.empty()
+            response, scores = asyncio.run(self._run_analysis(idea_input, placeholder))
+            placeholder.empty()
             
-            result = self._parse_claude_response(response.content[0].text)
+            result = self._build_result(response, scores)
+            # Results with unavailable dimensions are not cached so a resubmit can fill them in
+            if all(score.score is not None for score in result.scores):
+                self._cache_set(cache_key, asdict(result))
             return result
             
         except Exception as e:
             st.error(f"Error analyzing idea: {str(e)}")
-            return self._create_empty_result()
+            return None
+    
+    def generate_pitch_deck(self, idea_input: IdeaInput) -> Dict[str, str]:
+        # Slides are generated on demand since most of the output tokens go into them
+        cache_key = f"pitch_deck:{self._cache_key(idea_input)}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=2500,
+                temperature=0.7,
+                messages=self._build_pitch_deck_prompt(idea_input),
+                tools=[RECORD_PITCH_DECK_TOOL],
+                tool_choice={"type": "tool", "name": "record_pitch_deck"}
+            )
+            pitch_deck = self._tool_input(response, RECORD_PITCH_DECK_TOOL)
+            self._cache_set(cache_key, pitch_deck)
+            return pitch_deck
+            
+        except Exception as e:
+            st.error(f"Error generating pitch deck: {str(e)}")
+            return {}
+    
+    async def _run_analysis(self, idea_input: IdeaInput, placeholder) -> Tuple[Dict[str, Any], List[EvaluationScore]]:
+        # The client is created per run because its connection pool is bound to the event loop
+        async with AsyncAnthropic(api_key=self.api_key) as client:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            response, *scores = await asyncio.gather(
+                self._generate_plan(client, idea_input, placeholder),
+                *[self._score_dimension(client, semaphore, dimension, idea_input)
+                  for dimension in self.evaluation_dimensions]
+            )
+        return response, scores
+    
+    async def _generate_plan(self, client: AsyncAnthropic, idea_input: IdeaInput, placeholder) -> Dict[str, Any]:
+        async with client.messages.stream(
+            model=self.model,
+            max_tokens=2000,
+            temperature=0.7,
+            messages=self._build_analysis_prompt(idea_input),
+            tools=[RECORD_ANALYSIS_TOOL],
+            tool_choice={"type": "tool", "name": "record_analysis"}
+        ) as stream:
+            # Show the executive summary as soon as its partial tool input arrives
+            async for event in stream:
+                if event.type == "input_json" and isinstance(event.snapshot, dict):
+                    summary = event.snapshot.get("executive_summary")
+                    if summary:
+                        placeholder.markdown(summary)
+            response = await stream.get_final_message()
+        return self._tool_input(response, RECORD_ANALYSIS_TOOL)
     
-    def _build_analysis_prompt(self, idea_input: IdeaInput) -> str:
+    async def _score_dimension(self, client: AsyncAnthropic, semaphore: asyncio.Semaphore,
+                               dimension: str, idea_input: IdeaInput) -> EvaluationScore:
+        # One failed dimension is marked unavailable instead of failing the whole analysis
+        try:
+            async with semaphore:
+                response = await client.messages.create(
+                    model=self.model,
+                    max_tokens=300,
+                    temperature=0.7,
+                    messages=self._build_dimension_prompt(dimension, idea_input),
+                    tools=[RECORD_SCORE_TOOL],
+                    tool_choice={"type": "tool", "name": "record_score"}
+                )
+            data = response.content[0].input
+            score = min(max(int(data['score']), 0), 5)
+            return EvaluationScore(dimension=dimension, score=score, reasoning=data['reasoning'])
+        except Exception:
+            return EvaluationScore(dimension=dimension, score=None, reasoning="Score not available")
+    
+    def _tool_input(self, response, tool: Dict[str, Any]) -> Dict[str, Any]:
+        # A truncated or incomplete tool call is a failure, so it is never cached
+        if response.stop_reason == "max_tokens":
+            raise ValueError("Claude's response was cut off before it finished. Please try again.")
+        data = response.content[0].input
+        missing = [key for key in tool["input_schema"]["required"] if key not in data]
+        if missing:
+            raise ValueError(f"Claude's response is missing {', '.join(missing)}. Please try again.")
+        return data
+    
+    def _format_idea_details(self, idea_input: IdeaInput) -> str:
         return f"""
-You are an expert hackathon mentor analyzing a team's idea. Provide a structured analysis.
-
 IDEA: {idea_input.idea}
 TARGET USERS: {idea_input.target_users}
 TIME CONSTRAINT: {idea_input.time_constraint} hours
 TEAM SIZE: {idea_input.team_size} people
 GOALS: {idea_input.goals}
-
-Analyze this idea across these 8 dimensions (score 0-5 each):
-1. Problem clarity (0-5)
-2. User value (0-5)
-3. Market size & urgency (0-5)
-4. Differentiation/moat (0-5)
-5. Technical feasibility in 48 hours (0-5)
-6. Scalability path (0-5)
-7. Data dependencies (0-5)
-8. Risks & compliance (0-5)
-
-Also prepare detailed content for a 5-slide pitch deck presentation. Each slide should have substantial, well-developed content that teams can use directly in their presentations. Make the content comprehensive and compelling for hackathon judges.
-
-Please respond in this exact JSON format:
-{{
-    "executive_summary": "2-3 sentence high-level assessment",
-    "scores": [
-        {{"dimension": "Problem clarity", "score": 4, "reasoning": "Clear explanation"}},
-        // ... continue for all 8 dimensions
-    ],
-    "detailed_plan": "Structured implementation plan with key milestones",
-    "risk_flags": ["Risk 1", "Risk 2", "Risk 3"],
-    "build_checklist": ["Task 1", "Task 2", "Task 3", "..."],
-    "tech_stack": {{
-        "Frontend": ["React", "TypeScript", "Tailwind CSS"],
-        "Backend": ["Node.js", "Express", "PostgreSQL"],
-        "AI/ML": ["OpenAI API", "Langchain"],
-        "Infrastructure": ["Vercel", "Supabase"],
-        "Tools": ["Git", "VS Code", "Figma"]
-    }},
-    "pitch_deck": {{
-        "slide1_problem": "Detailed problem statement (3-4 paragraphs): Start with a compelling hook, describe the pain points in detail, quantify the problem with statistics if possible, clearly define the target audience and their struggles, and explain why this problem matters now. Include emotional impact and urgency.",
-        "slide2_solution": "Comprehensive solution description (3-4 paragraphs): Clearly explain your solution approach, detail 3-4 key features with specific benefits, highlight what makes your solution unique compared to alternatives, describe the user experience and journey, and explain the core value proposition with concrete examples.",
-        "slide3_techstack": "Detailed technical approach (3-4 paragraphs): Explain your technology choices and why they're optimal for this problem, describe the system architecture and key components, highlight any innovative technical approaches or algorithms, discuss scalability and performance considerations, and mention specific frameworks, APIs, or tools that make your solution powerful.",
-        "slide4_market": "Comprehensive market analysis (3-4 paragraphs): Provide market size data with specific numbers (TAM, SAM, SOM if possible), identify target customer segments with demographics, analyze competitors and your competitive advantages, discuss market timing and trends that favor your solution, and include validation evidence like user interviews or early traction.",
-        "slide5_business_model": "Detailed business strategy (3-4 paragraphs): Clearly explain your revenue model with specific pricing strategy, describe customer acquisition channels and growth tactics, outline key partnerships and distribution strategies, provide financial projections or unit economics, discuss scalability plans and expansion opportunities, and explain your competitive moat and defensibility."
-    }}
-}}
 """
     
-    def _parse_claude_response(self, response: str) -> AnalysisResult:
-        try:
-            # Extract JSON from response
-            start = response.find('{')
-            end = response.rfind('}') + 1
-            json_str = response[start:end]
-            data = json.loads(json_str)
-            
-            scores = [EvaluationScore(**score) for score in data['scores']]
-            overall_score = sum(score.score for score in scores) / len(scores)
-            
-            return AnalysisResult(
-                executive_summary=data['executive_summary'],
-                scores=scores,
-                detailed_plan=data['detailed_plan'],
-                risk_flags=data['risk_flags'],
-                build_checklist=data['build_checklist'],
-                tech_stack=data.get('tech_stack', {}),
-                pitch_deck=data.get('pitch_deck', {}),
-                overall_score=overall_score
-            )
-        except Exception as e:
-            st.error(f"Error parsing response: {str(e)}")
-            return self._create_empty_result()
+    def _build_analysis_prompt(self, idea_input: IdeaInput) -> List[Dict[str, Any]]:
+        return [{"role": "user", "content": STATIC_PREFIX + self._format_idea_details(idea_input)}]
+    
+    def _build_pitch_deck_prompt(self, idea_input: IdeaInput) -> List[Dict[str, Any]]:
+        return [{"role": "user", "content": PITCH_DECK_PREFIX + self._format_idea_details(idea_input)}]
+    
+    def _build_dimension_prompt(self, dimension: str, idea_input: IdeaInput) -> List[Dict[str, Any]]:
+        return [{
+            "role": "user",
+            "content": f"{DIMENSION_PREFIX}\nDIMENSION: {dimension}\n{self._format_idea_details(idea_input)}"
+        }]
     
-    def _create_empty_result(self) -> AnalysisResult:
+    def _build_result(self, data: Dict[str, Any], scores: List[EvaluationScore]) -> AnalysisResult:
+        # Average in a single pass, skipping unavailable dimensions
+        total = 0
+        count = 0
+        for score in scores:
+            if score.score is not None:
+                total += score.score
+                count += 1
+        overall_score = total / count if count else None
+        
+        # The pitch deck is generated on demand
         return AnalysisResult(
-            executive_summary="Analysis failed",
-            scores=[],
-            detailed_plan="",
-            risk_flags=[],
-            build_checklist=[],
-            tech_stack={},
+            executive_summary=data['executive_summary'],
+            scores=scores,
+            detailed_plan=data['detailed_plan'],
+            risk_flags=data['risk_flags'],
+            build_checklist=data['build_checklist'],
+            tech_stack=data['tech_stack'],
             pitch_deck={},
-            overall_score=0.0
+            overall_score=overall_score
         )
+    
+    def _cache_get(self, key: str) -> Any:
+        # A broken cache only costs a fresh API call
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(key)
+        except Exception:
+            return None
+    
+    def _cache_set(self, key: str, value: Any) -> None:
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(key, value, expire=CACHE_TTL_SECONDS)
+        except Exception:
+            pass
+    
+    def _cache_key(self, idea_input: IdeaInput) -> str:
+        payload = json.dumps({"model": self.model, **asdict(idea_input)}, sort_keys=True)
+        return hashlib.blake2b(payload.encode()).hexdigest()
+    
+    def _result_from_dict(self, data: Dict[str, Any]) -> AnalysisResult:
+        scores = [EvaluationScore(**score) for score in data['scores']]
+        return AnalysisResult(**{**data, 'scores': scores})
+
+@st.cache_resource
+def get_coach(model: str) -> HackathonIdeaCoach:
+    # One coach per model, so reruns reuse the API client and disk cache
+    return HackathonIdeaCoach(model)
+
+@st.cache_resource
+def _css() -> str:
+    # Dark mode CSS styling, built once and reused across reruns
+    return """
+<style>
+.stApp {
+    background-color: #0e1117;
+    color: #fafafa;
+}
+
+.main .block-container {
+    background-color: #0e1117;
+    padding-top: 2rem;
+}
+
+.metric-container {
+    background-color: #1e2329;
+    border: 1px solid #3d4043;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    margin: 0.5rem 0;
+}
+
+.score-high { color: #00d4aa; }
+.score-medium { color: #ffb000; }
+.score-low { color: #ff4b4b; }
+
+.stSelectbox > div > div {
+    background-color: #1e2329;
+    border: 1px solid #3d4043;
+}
+
+.stTextInput > div > div > input {
+    background-color: #1e2329;
+    border: 1px solid #3d4043;
+    color: #fafafa;
+}
+
+.stTextArea > div > div > textarea {
+    background-color: #1e2329;
+    border: 1px solid #3d4043;
+    color: #fafafa;
+}
+
+.stButton > button {
+    background-color: #ff4b4b;
+    border: none;
+    color: white;
+    border-radius: 0.5rem;
+}
+
+.stButton > button:hover {
+    background-color: #ff6b6b;
+    border: none;
+}
+
+.stExpander {
+    background-color: #1e2329;
+    border: 1px solid #3d4043;
+    border-radius: 0.5rem;
+}
+
+.stAlert {
+    background-color: #1e2329;
+    border: 1px solid #3d4043;
+}
+
+.stSuccess {
+    background-color: #1a2a1a;
+    border: 1px solid: #00d4aa;
+    color: #00d4aa;
+}
+
+.stWarning {
+    background-color: #2a2a1a;
+    border: 1px solid #ffb000;
+    color: #ffb000;
+}
+
+.stError {
+    background-color: #2a1a1a;
+    border: 1px solid #ff4b4b;
+    color: #ff4b4b;
+}
+
+.stInfo {
+    background-color: #1a1a2a;
+    border: 1px solid #4dabf7;
+    color: #4dabf7;
+}
+
+h1, h2, h3, h4, h5, h6 {
+    color: #fafafa;
+}
+
+.stMetric > div {
+    background-color: #1e2329;
+    border: 1px solid #3d4043;
+    border-radius: 0.5rem;
+    padding: 1rem;
+}
+
+.stCheckbox > label {
+    color: #fafafa;
+}
+
+hr {
+    border-color: #3d4043;
+}
+</style>
+"""
+
+@st.cache_data
+def _format_slide(content: str) -> List[str]:
+    # Split slide content into sentences for better readability
+    return [paragraph.strip() + '.' for paragraph in content.split('. ') if paragraph.strip()]
+
+_HOW_IT_WORKS = """
+1. **Describe your idea** - Tell us about your hackathon concept
+2. **Set constraints** - Team size, time available, and goals  
+3. **Get analysis** - Claude evaluates your idea across 8 key dimensions
+4. **Review results** - See scores, risks, and a detailed implementation plan
+5. **Explore scenarios** - Test how changes might affect your approach
+"""
+
+_FOOTER_HTML = """
+    <div style='text-align: center; color: #666; font-size: 12px; margin-top: 1rem; padding: 10px;'>
+        <p>Made with ❤️ by <strong>Geetanshi Goel</strong></p>
+        <div style='margin-top: 8px;'>
+            <a href="https://github.com/geetanshi0205" target="_blank" style='margin: 0 8px; text-decoration: none;'>
+                <svg width="18" height="18" viewBox="0 0 24 24" fill="currentColor" style="vertical-align: middle;">
+                    <path d="M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.30.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6.086 8.199-11.386 0-6.627-5.373-12-12-12z"/>
+                </svg>
+            </a>
+            <a href="https://www.linkedin.com/in/geetanshi-goel-49ba5832b/" target="_blank" style='margin: 0 8px; text-decoration: none;'>
+                <svg width="18" height="18" viewBox="0 0 24 24" fill="currentColor" style="vertical-align: middle;">
+                    <path d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"/>
+                </svg>
+            </a>
+        </div>
+    </div>
+"""
 
 def main():
     st.set_page_config(
@@ -159,127 +485,13 @@ def main():
         initial_sidebar_state="collapsed"
     )
     
-    # Dark mode CSS styling
-    st.markdown("""
-    <style>
-    .stApp {
-        background-color: #0e1117;
-        color: #fafafa;
-    }
-    
-    .main .block-container {
-        background-color: #0e1117;
-        padding-top: 2rem;
-    }
-    
-    .metric-container {
-        background-color: #1e2329;
-        border: 1px solid #3d4043;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    
-    .score-high { color: #00d4aa; }
-    .score-medium { color: #ffb000; }
-    .score-low { color: #ff4b4b; }
-    
-    .stSelectbox > div > div {
-        background-color: #1e2329;
-        border: 1px solid #3d4043;
-    }
-    
-    .stTextInput > div > div > input {
-        background-color: #1e2329;
-        border: 1px solid #3d4043;
-        color: #fafafa;
-    }
-    
-    .stTextArea > div > div > textarea {
-        background-color: #1e2329;
-        border: 1px solid #3d4043;
-        color: #fafafa;
-    }
-    
-    .stButton > button {
-        background-color: #ff4b4b;
-        border: none;
-        color: white;
-        border-radius: 0.5rem;
-    }
-    
-    .stButton > button:hover {
-        background-color: #ff6b6b;
-        border: none;
-    }
-    
-    .stExpander {
-        background-color: #1e2329;
-        border: 1px solid #3d4043;
-        border-radius: 0.5rem;
-    }
-    
-    .stAlert {
-        background-color: #1e2329;
-        border: 1px solid #3d4043;
-    }
-    
-    .stSuccess {
-        background-color: #1a2a1a;
-        border: 1px solid: #00d4aa;
-        color: #00d4aa;
-    }
-    
-    .stWarning {
-        background-color: #2a2a1a;
-        border: 1px solid #ffb000;
-        color: #ffb000;
-    }
-    
-    .stError {
-        background-color: #2a1a1a;
-        border: 1px solid #ff4b4b;
-        color: #ff4b4b;
-    }
-    
-    .stInfo {
-        background-color: #1a1a2a;
-        border: 1px solid #4dabf7;
-        color: #4dabf7;
-    }
-    
-    h1, h2, h3, h4, h5, h6 {
-        color: #fafafa;
-    }
-    
-    .stMetric > div {
-        background-color: #1e2329;
-        border: 1px solid #3d4043;
-        border-radius: 0.5rem;
-        padding: 1rem;
-    }
-    
-    .stCheckbox > label {
-        color: #fafafa;
-    }
-    
-    hr {
-        border-color: #3d4043;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_css(), unsafe_allow_html=True)
     
     st.title("🎯 PitchSnitch")
     st.subheader("Transform your raw idea into a winning hackathon strategy")
     
     with st.expander("ℹ️ How it works"):
-        st.write("""
-        1. **Describe your idea** - Tell us about your hackathon concept
-        2. **Set constraints** - Team size, time available, and goals  
-        3. **Get analysis** - Claude evaluates your idea across 8 key dimensions
-        4. **Review results** - See scores, risks, and a detailed implementation plan
-        5. **Explore scenarios** - Test how changes might affect your approach
-        """)
+        st.write(_HOW_IT_WORKS)
     
     st.divider()
     
@@ -288,8 +500,6 @@ def main():
         st.error("Please set your ANTHROPIC_API_KEY environment variable")
         st.stop()
     
-    coach = HackathonIdeaCoach()
-    
     # Input Form
     with st.form("idea_input"):
         st.header("🎯 Tell us about your hackathon idea")
@@ -326,23 +536,43 @@ def main():
             height=80
         )
         
+        analysis_mode = st.selectbox(
+            "Analysis mode",
+            options=list(MODEL_OPTIONS),
+            index=0,
+            help="Fast uses Claude Haiku, Balanced uses Sonnet, Best uses Opus"
+        )
+        
         submitted = st.form_submit_button("🎯 Snitch My Pitch", type="primary")
     
     if submitted and idea and target_users and goals:
         idea_input = IdeaInput(idea, target_users, time_constraint, team_size, goals)
+        model = MODEL_OPTIONS[analysis_mode]
+        coach = get_coach(model)
         
         with st.spinner("Analyzing your idea with Claude..."):
             result = coach.analyze_idea(idea_input)
         
+        # Keep the analysis across reruns so the pitch deck can be generated on demand
+        st.session_state["idea_input"] = idea_input
+        st.session_state["model"] = model
+        st.session_state["result"] = result
+    
+    if "result" in st.session_state:
+        result = st.session_state["result"]
+        
         # Display Results
-        if result.overall_score > 0:
+        if result is not None:
             # Executive Summary
             st.header("📊 Executive Summary")
             st.success(result.executive_summary)
             
             # Overall Score
-            score_color = "green" if result.overall_score >= 3.5 else "orange" if result.overall_score >= 2.5 else "red"
-            st.metric("Overall Score", f"{result.overall_score:.1f}/5.0", delta=None)
+            if result.overall_score is not None:
+                score_color = "green" if result.overall_score >= 3.5 else "orange" if result.overall_score >= 2.5 else "red"
+                st.metric("Overall Score", f"{result.overall_score:.1f}/5.0", delta=None)
+            else:
+                st.metric("Overall Score", "N/A", delta=None)
             
             # Detailed Scores
             st.header("📈 Detailed Analysis")
@@ -350,7 +580,8 @@ def main():
             
             for i, score in enumerate(result.scores):
                 with col1 if i % 2 == 0 else col2:
-                    with st.expander(f"{score.dimension}: {score.score}/5"):
+                    score_label = f"{score.score}/5" if score.score is not None else "N/A"
+                    with st.expander(f"{score.dimension}: {score_label}"):
                         st.write(score.reasoning)
             
             # Detailed Plan
@@ -368,12 +599,7 @@ def main():
             if result.tech_stack:
                 for category, technologies in result.tech_stack.items():
                     if technologies:
-                        st.subheader(f"**{category}**")
-                        tech_cols = st.columns(min(len(technologies), 3))
-                        for i, tech in enumerate(technologies):
-                            with tech_cols[i % 3]:
-                                st.markdown(f"• {tech}")
-                        st.write("")
+                        st.markdown(f"**{category}**\n\n" + " · ".join(f"`{tech}`" for tech in technologies))
             
             # Build Checklist
             st.header("✅ 48-Hour Build Checklist")
@@ -384,88 +610,29 @@ def main():
             st.header("📊 5-Slide Pitch Deck")
             st.write("Comprehensive, judge-ready presentation content for your hackathon pitch:")
             
+            if not result.pitch_deck and st.button("📊 Generate Pitch Deck"):
+                with st.spinner("Writing your pitch deck with Claude..."):
+                    # Use the model that produced the analysis on screen, not the current form selection
+                    coach = get_coach(st.session_state["model"])
+                    result.pitch_deck = coach.generate_pitch_deck(st.session_state["idea_input"])
+                if not result.pitch_deck:
+                    st.warning("Pitch deck content not available. Try generating it again.")
+            
             if result.pitch_deck:
-                # Slide 1: Problem
-                with st.expander("🎯 Slide 1: Problem Statement", expanded=True):
-                    st.markdown("### 🔍 The Problem We're Solving")
-                    content = result.pitch_deck.get('slide1_problem', 'Problem statement not available')
-                    # Format paragraphs for better readability
-                    paragraphs = content.split('. ')
-                    for i, paragraph in enumerate(paragraphs):
-                        if paragraph.strip():
-                            st.markdown(f"**{paragraph.strip()}.**" if i == 0 else f"{paragraph.strip()}.")
-                    st.divider()
-                    st.caption("💡 **Presentation Tip**: Start with a relatable scenario or shocking statistic to grab attention")
-                
-                # Slide 2: Solution  
-                with st.expander("💡 Slide 2: Our Solution", expanded=False):
-                    st.markdown("### 🚀 How We Solve It")
-                    content = result.pitch_deck.get('slide2_solution', 'Solution description not available')
-                    paragraphs = content.split('. ')
-                    for i, paragraph in enumerate(paragraphs):
-                        if paragraph.strip():
-                            st.markdown(f"**{paragraph.strip()}.**" if i == 0 else f"{paragraph.strip()}.")
-                    st.divider()
-                    st.caption("💡 **Presentation Tip**: Demo key features live if possible, use visuals to show before/after")
-                
-                # Slide 3: Tech Stack
-                with st.expander("🛠️ Slide 3: Technical Implementation", expanded=False):
-                    st.markdown("### ⚙️ How We Built It")
-                    content = result.pitch_deck.get('slide3_techstack', 'Technical details not available')
-                    paragraphs = content.split('. ')
-                    for i, paragraph in enumerate(paragraphs):
-                        if paragraph.strip():
-                            st.markdown(f"**{paragraph.strip()}.**" if i == 0 else f"{paragraph.strip()}.")
-                    st.divider()
-                    st.caption("💡 **Presentation Tip**: Show architecture diagrams, highlight technical challenges overcome")
-                
-                # Slide 4: Market
-                with st.expander("📈 Slide 4: Market Opportunity", expanded=False):
-                    st.markdown("### 🌍 Market & Business Impact")
-                    content = result.pitch_deck.get('slide4_market', 'Market analysis not available')
-                    paragraphs = content.split('. ')
-                    for i, paragraph in enumerate(paragraphs):
-                        if paragraph.strip():
-                            st.markdown(f"**{paragraph.strip()}.**" if i == 0 else f"{paragraph.strip()}.")
-                    st.divider()
-                    st.caption("💡 **Presentation Tip**: Use charts for market size, mention specific customer validation")
-                
-                # Slide 5: Business Model
-                with st.expander("💰 Slide 5: Business Strategy", expanded=False):
-                    st.markdown("### 💼 How We Scale & Monetize")
-                    content = result.pitch_deck.get('slide5_business_model', 'Business model not available')
-                    paragraphs = content.split('. ')
-                    for i, paragraph in enumerate(paragraphs):
-                        if paragraph.strip():
-                            st.markdown(f"**{paragraph.strip()}.**" if i == 0 else f"{paragraph.strip()}.")
-                    st.divider()
-                    st.caption("💡 **Presentation Tip**: Show revenue projections, explain competitive advantages clearly")
+                for index, (key, title, heading, fallback, tip) in enumerate(PITCH_DECK_SLIDES):
+                    with st.expander(title, expanded=index == 0):
+                        st.markdown(heading)
+                        paragraphs = _format_slide(result.pitch_deck.get(key, fallback))
+                        # Bold the opening sentence and render the slide in a single element
+                        if paragraphs:
+                            st.markdown("\n\n".join([f"**{paragraphs[0]}**", *paragraphs[1:]]))
+                        st.divider()
+                        st.caption(f"💡 **Presentation Tip**: {tip}")
                 
                 st.success("🎯 **Final Pro Tips**: Keep each slide under 3 minutes, practice transitions, end with specific asks (funding, partnerships, users), and prepare for Q&A!")
-            else:
-                st.warning("Pitch deck content not available. Try regenerating the analysis.")
     
     # Footer
-    st.markdown(
-        """
-        <div style='text-align: center; color: #666; font-size: 12px; margin-top: 1rem; padding: 10px;'>
-            <p>Made with ❤️ by <strong>Geetanshi Goel</strong></p>
-            <div style='margin-top: 8px;'>
-                <a href="https://github.com/geetanshi0205" target="_blank" style='margin: 0 8px; text-decoration: none;'>
-                    <svg width="18" height="18" viewBox="0 0 24 24" fill="currentColor" style="vertical-align: middle;">
-                        <path d="M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.30.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6.086 8.199-11.386 0-6.627-5.373-12-12-12z"/>
-                    </svg>
-                </a>
-                <a href="https://www.linkedin.com/in/geetanshi-goel-49ba5832b/" target="_blank" style='margin: 0 8px; text-decoration: none;'>
-                    <svg width="18" height="18" viewBox="0 0 24 24" fill="currentColor" style="vertical-align: middle;">
-                        <path d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"/>
-                    </svg>
-                </a>
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file